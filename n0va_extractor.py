@@ -15,17 +15,34 @@ License: MIT
 
 import os
 import sys
+import errno
 import shutil
 import hashlib
 import argparse
+import json
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict, Set, Iterator
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    # Optional: BLAKE3 is considerably faster than MD5 for duplicate detection
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    # Optional: progress bar instead of periodic progress lines
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# Set up logging (handlers are configured in main())
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 class Color:
     """ANSI color codes for terminal output"""
@@ -52,17 +69,241 @@ def print_banner():
 """
     print(banner)
 
-def get_file_hash(file_path: Path) -> str:
-    """Generate MD5 hash of a file for duplicate detection"""
-    hash_md5 = hashlib.md5()
+# Read size used when hashing files (1 MiB keeps syscall count low on large wallpapers)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def new_hasher(file_size: int = 0):
+    """
+    Create a hash object for duplicate detection
+    
+    Uses BLAKE3 when the optional blake3 package is installed (multithreaded
+    for files larger than one hash chunk), otherwise falls back to MD5.
+    """
+    if blake3 is not None:
+        if file_size > HASH_CHUNK_SIZE:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return blake3.blake3()
+    return hashlib.md5()
+
+def _fadvise(fd: int, advice: str, file_path: Path) -> None:
+    """Give the kernel an access-pattern hint (e.g. 'POSIX_FADV_SEQUENTIAL'); failures are only logged"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+    except OSError as e:
+        logger.debug("%s hint failed for %s: %s", advice, file_path, e)
+
+def get_file_hash(file_path: Path, file_size: int = 0, drop_cache: bool = False) -> bytes:
+    """
+    Generate a hash of a file for duplicate detection
+    
+    Set drop_cache when the file won't be read again (e.g. it has already been
+    copied) so its pages are evicted from the OS page cache after hashing.
+    """
+    hasher = new_hasher(file_size)
+    buf = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buf)
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        # Unbuffered, since we read straight into our own buffer
+        with open(file_path, "rb", buffering=0) as f:
+            # Ask for aggressive readahead while hashing
+            _fadvise(f.fileno(), 'POSIX_FADV_SEQUENTIAL', file_path)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+            if drop_cache:
+                # Don't let the hashed wallpapers evict more useful pages from the cache
+                _fadvise(f.fileno(), 'POSIX_FADV_DONTNEED', file_path)
+        return hasher.digest()
     except Exception as e:
-        logger.error(f"Error hashing file {file_path}: {e}")
-        return ""
+        logger.error("Error hashing file %s: %s", file_path, e)
+        return b""
+
+def drop_page_cache(file_path: Path) -> None:
+    """Evict a file's pages from the OS page cache once it won't be read again (no-op without posix_fadvise)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError as e:
+        logger.debug("Could not drop page cache for %s: %s", file_path, e)
+        return
+    try:
+        _fadvise(fd, 'POSIX_FADV_DONTNEED', file_path)
+    finally:
+        os.close(fd)
+
+# Bytes read from the start of a file for the cheap duplicate fingerprint
+QUICK_HASH_SIZE = 64 * 1024
+
+# Flags for raw os.open reads (O_BINARY only exists, and matters, on Windows)
+_O_RDONLY_BINARY = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+# Buffer size for the userspace copy fallback
+COPY_BUFFER_SIZE = 256 * 1024
+
+# Platforms where shutil.copyfile copies in the kernel (sendfile / fcopyfile);
+# elsewhere our larger-buffer userspace copy beats its default loop
+_SHUTIL_HAS_KERNEL_COPY = (hasattr(os, 'sendfile') and sys.platform.startswith('linux')) or sys.platform == 'darwin'
+
+# errno values meaning copy_file_range can't handle this pair of files
+_COPY_FILE_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """
+    Copy a file with os.copy_file_range (Linux), allowing in-kernel and reflink copies
+    
+    Returns:
+        bool: True if the file was copied, False if copy_file_range is unsupported here
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        total_size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        while True:
+            try:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), max(total_size - copied, COPY_BUFFER_SIZE))
+            except OSError as e:
+                if copied == 0 and e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                    return False
+                raise
+            if n == 0:
+                # Some filesystems (FUSE, overlay, procfs-like files) report EOF straight
+                # away instead of failing; let the userspace copy handle those
+                return copied > 0 or total_size == 0
+            copied += n
+
+def _copy_file2(src: Path, dst: Path) -> bool:
+    """
+    Copy a file with the Win32 CopyFile2 API
+    
+    Returns:
+        bool: True if the file was copied, False if CopyFile2 is unavailable or failed
+    """
+    try:
+        import ctypes
+        copy_file2 = ctypes.windll.kernel32.CopyFile2
+    except (ImportError, AttributeError):
+        return False
+    return copy_file2(str(src), str(dst), None) == 0
+
+def _copy_readinto(src: Path, dst: Path, bufsize: int = COPY_BUFFER_SIZE) -> None:
+    """Copy a file in userspace through one reusable buffer (like CPython's shutil._copyfileobj_readinto)"""
+    buf = bytearray(bufsize)
+    with memoryview(buf) as view, open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb') as fdst:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            if n < bufsize:
+                with view[:n] as chunk:
+                    fdst.write(chunk)
+            else:
+                fdst.write(view)
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a file and its metadata using the fastest mechanism the OS offers
+    
+    Tries CopyFile2 on Windows and copy_file_range on Linux, falling back to
+    shutil.copyfile where it has a kernel fast path (sendfile on Linux,
+    fcopyfile on macOS) and to a 256 KiB userspace copy elsewhere. Metadata is
+    preserved like shutil.copy2.
+    """
+    if os.name == 'nt':
+        copied = _copy_file2(src, dst)
+    else:
+        copied = _copy_file_range(src, dst)
+    
+    if not copied:
+        # e.g. EXDEV across filesystems on older kernels, or no copy_file_range at all
+        if _SHUTIL_HAS_KERNEL_COPY:
+            shutil.copyfile(src, dst)
+        else:
+            _copy_readinto(src, dst)
+    
+    shutil.copystat(src, dst)
+
+# Image signatures that are a fixed prefix of the file (WebP is checked separately)
+_MAGIC = {
+    b'\x89PNG\r\n\x1a\n': 'PNG',
+    b'\xff\xd8\xff': 'JPEG',
+    b'GIF87a': 'GIF',
+    b'GIF89a': 'GIF',
+    b'BM': 'BMP',
+}
+_MAGIC_LENGTHS = sorted({len(magic) for magic in _MAGIC}, reverse=True)
+
+def _read_up_to(fd: int, size: int) -> bytes:
+    """Read size bytes from fd, or fewer only at EOF (a single os.read may return short on network/FUSE filesystems)"""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = os.read(fd, remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+def detect_image_format(header: bytes) -> Optional[str]:
+    """
+    Identify an image format from the first 16 bytes of a file
+    
+    Returns:
+        str: Image format ('PNG', 'JPEG', 'WebP', etc.) or None if not an image
+    """
+    # Check fixed-prefix signatures, one dict lookup per prefix length
+    for length in _MAGIC_LENGTHS:
+        image_format = _MAGIC.get(header[:length])
+        if image_format:
+            return image_format
+    
+    # Check for WebP signature
+    if header.startswith(b'RIFF') and header[8:12] == b'WEBP':
+        return 'WebP'
+    
+    return None
+
+def inspect_file(file_path: Path, file_size: Optional[int] = None, fingerprint: bool = True) -> Tuple[Optional[str], int, Optional[Tuple[int, bytes]]]:
+    """
+    Detect a file's image format and build its quick duplicate fingerprint with a single read
+    
+    The fingerprint is the file size plus a hash of the first 64 KiB. Files
+    with different fingerprints are guaranteed to differ; equal fingerprints
+    must be confirmed with a full hash.
+    
+    Args:
+        file_path: Path to the file to inspect
+        file_size: File size if already known (saves an fstat call)
+        fingerprint: Whether to compute the quick fingerprint
+        
+    Returns:
+        Tuple of (image_format or None, file_size, fingerprint or None)
+    """
+    # Raw fd reads avoid building a Python file object per candidate; only read
+    # the whole fingerprint prefix when it will actually be hashed
+    fd = os.open(file_path, _O_RDONLY_BINARY)
+    try:
+        if file_size is None:
+            file_size = os.fstat(fd).st_size
+        head = _read_up_to(fd, QUICK_HASH_SIZE if fingerprint else 16)
+    finally:
+        os.close(fd)
+    
+    image_format = detect_image_format(head[:16])
+    
+    quick_key = None
+    if fingerprint and image_format:
+        hasher = new_hasher()
+        hasher.update(head)
+        quick_key = (file_size, hasher.digest())
+    
+    return image_format, file_size, quick_key
 
 def verify_image_format(file_path: Path) -> Optional[str]:
     """
@@ -72,35 +313,155 @@ def verify_image_format(file_path: Path) -> Optional[str]:
         str: Image format ('PNG', 'JPEG', 'WebP', etc.) or None if not an image
     """
     try:
-        with open(file_path, 'rb') as f:
-            header = f.read(16)
-            
-        # Check for PNG signature
-        if header.startswith(b'\x89PNG\r\n\x1a\n'):
-            return 'PNG'
-        
-        # Check for JPEG signature
-        if header.startswith(b'\xff\xd8\xff'):
-            return 'JPEG'
-        
-        # Check for WebP signature
-        if header.startswith(b'RIFF') and header[8:12] == b'WEBP':
-            return 'WebP'
-        
-        # Check for GIF signature
-        if header.startswith(b'GIF87a') or header.startswith(b'GIF89a'):
-            return 'GIF'
-        
-        # Check for BMP signature
-        if header.startswith(b'BM'):
-            return 'BMP'
-        
-        return None
+        fd = os.open(file_path, _O_RDONLY_BINARY)
+        try:
+            header = _read_up_to(fd, 16)
+        finally:
+            os.close(fd)
+        return detect_image_format(header)
         
     except Exception as e:
-        logger.error(f"Error verifying file format for {file_path}: {e}")
+        logger.error("Error verifying file format for %s: %s", file_path, e)
         return None
 
+def get_fingerprint_cache_file() -> Path:
+    """Return the location of the on-disk fingerprint cache"""
+    if os.name == 'nt' and os.environ.get('LOCALAPPDATA'):
+        cache_root = Path(os.environ['LOCALAPPDATA'])
+    elif os.environ.get('XDG_CACHE_HOME'):
+        cache_root = Path(os.environ['XDG_CACHE_HOME'])
+    else:
+        cache_root = Path.home() / '.cache'
+    return cache_root / 'n0va_extractor' / 'fingerprints.json'
+
+def hash_algorithm() -> str:
+    """Name of the algorithm used by new_hasher(), recorded alongside cached hashes"""
+    return 'blake3' if blake3 is not None else 'md5'
+
+def load_fingerprint_cache(cache_file: Path) -> Dict[str, list]:
+    """
+    Load cached full-file hashes from a previous run
+    
+    Returns:
+        Dict mapping file path to [mtime_ns, size, hex digest]; empty if the cache is
+        missing, unreadable or was built with a different hash algorithm
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable fingerprint cache %s: %s", cache_file, e)
+        return {}
+    
+    if not isinstance(data, dict) or data.get('algorithm') != hash_algorithm():
+        return {}
+    files = data.get('files')
+    if not isinstance(files, dict):
+        return {}
+    
+    # Drop malformed entries so they are simply re-hashed
+    return {
+        path: entry for path, entry in files.items()
+        if isinstance(entry, list) and len(entry) == 3
+        and isinstance(entry[0], int) and isinstance(entry[1], int) and isinstance(entry[2], str)
+    }
+
+def save_fingerprint_cache(cache_file: Path, files: Dict[str, list]) -> None:
+    """Write cached full-file hashes to disk, replacing the previous cache atomically"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'algorithm': hash_algorithm(), 'files': files}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Could not save fingerprint cache %s: %s", cache_file, e)
+
+def prune_fingerprint_cache(files: Dict[str, list], cache_path: Path, scanned: Set[str]) -> Dict[str, list]:
+    """
+    Drop cached hashes for files under cache_path that this scan no longer found
+    
+    Entries for other cache directories are kept, since the fingerprint
+    cache is shared by every directory the tool is run on.
+    """
+    prefix = os.path.join(os.path.normcase(os.path.abspath(cache_path)), '')
+    return {
+        path: entry for path, entry in files.items()
+        if path in scanned or not os.path.normcase(path).startswith(prefix)
+    }
+
+# Cache file suffixes: finished downloads and incomplete ones
+_NDF_SUFFIXES = ('.ndf', '.ndf_tmp')
+
+def _disk_order_key(entry: os.DirEntry) -> Tuple[int, int, str]:
+    """Sort key grouping entries by device, then inode (the stat result is cached on the entry)"""
+    try:
+        device = entry.stat().st_dev
+    except OSError:
+        # Vanished files sort first and are reported as failures later
+        device = -1
+    return device, entry.inode(), entry.path
+
+def find_ndf_entries(cache_path: Path) -> List[os.DirEntry]:
+    """
+    Find all .ndf files in the cache directory in a single os.scandir walk
+    
+    The returned DirEntry objects cache their type and stat information, so
+    callers can read file sizes without another syscall per file.
+    
+    Args:
+        cache_path: Path to the N0va Desktop cache directory
+        
+    Returns:
+        List of DirEntry objects for .ndf files, sorted by (device, inode) on
+        POSIX systems and by path elsewhere
+    """
+    entries = []
+    root = str(cache_path)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except FileNotFoundError:
+            if directory == root:
+                logger.error("Cache directory does not exist: %s", cache_path)
+                return entries
+            logger.debug("Directory disappeared during scan: %s", directory)
+            continue
+        except OSError as e:
+            logger.debug("Cannot scan directory %s: %s", directory, e)
+            continue
+        
+        with it:
+            try:
+                for entry in it:
+                    # One suffix test per entry covers both .ndf and .ndf_tmp
+                    name = os.path.normcase(entry.name)
+                    if name.endswith(_NDF_SUFFIXES) and entry.is_file():
+                        if not name.endswith('.ndf'):
+                            # .ndf_tmp files are incomplete downloads; only keep non-empty ones.
+                            # N0va may rename or delete them mid-scan, so skip just this entry on error
+                            try:
+                                if entry.stat().st_size == 0:
+                                    continue
+                            except OSError:
+                                continue
+                        entries.append(entry)
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+            except OSError as e:
+                logger.debug("Error while scanning directory %s: %s", directory, e)
+    
+    if os.name == 'posix':
+        # (device, inode) order roughly follows on-disk layout, turning scattered reads into mostly sequential ones
+        entries.sort(key=_disk_order_key)
+    else:
+        entries.sort(key=lambda entry: Path(entry.path))
+    return entries
+
 def find_ndf_files(cache_path: Path) -> List[Path]:
     """
     Find all .ndf files in the cache directory
@@ -111,25 +472,202 @@ def find_ndf_files(cache_path: Path) -> List[Path]:
     Returns:
         List of Path objects for .ndf files
     """
-    ndf_files = []
+    return [Path(entry.path) for entry in find_ndf_entries(cache_path)]
+
+# Without tqdm, print a progress line every this many files
+PROGRESS_INTERVAL = 50
+
+# Minimum number of files inspected ahead of the copy loop
+PREFETCH_DEPTH = 8
+
+def hash_file_cached(file_path: Path, file_size: int, mtime: Optional[int], cached: Optional[list], drop_cache: bool) -> Tuple[bytes, bool]:
+    """
+    Full-hash a file, reusing a fingerprint cache entry while its (mtime, size) still match
     
-    if not cache_path.exists():
-        logger.error(f"Cache directory does not exist: {cache_path}")
-        return ndf_files
+    Returns:
+        Tuple of (hash, read_from_disk)
+    """
+    if cached and mtime is not None and cached[:2] == [mtime, file_size]:
+        try:
+            return bytes.fromhex(cached[2]), False
+        except ValueError:
+            logger.debug("Ignoring malformed cached hash for %s", file_path)
+    return get_file_hash(file_path, file_size, drop_cache), True
+
+def copy_wallpaper(ndf_file: Path, output_file: Path, drop_after: bool, size_mb: float, image_format: str) -> Tuple[str, Optional[str]]:
+    """Copy an accepted file to the output directory, returning (status, message) to report"""
+    try:
+        fast_copy(ndf_file, output_file)
+        if drop_after:
+            drop_page_cache(ndf_file)
+        logger.debug("Extracted %s -> %s (%.1fMB, %s)", ndf_file, output_file.name, size_mb, image_format)
+        return 'extracted', None
+    except Exception as e:
+        logger.error("Failed to process %s: %s", ndf_file, e)
+        return 'failed', f"{Color.FAIL}  ❌ Error processing {ndf_file.name}: {e}{Color.ENDC}"
+
+def _completed(result: Tuple[str, Optional[str]]) -> Future:
+    """Wrap an immediate result in a finished Future"""
+    future = Future()
+    future.set_result(result)
+    return future
+
+def results_in_order(futures: Iterator[Future], window: int) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Yield future results in submission order
+    
+    Finished results are yielded as soon as everything before them is done;
+    once window results are outstanding, waits for the oldest one.
+    """
+    outstanding = deque()
+    for future in futures:
+        outstanding.append(future)
+        while outstanding and (outstanding[0].done() or len(outstanding) > window):
+            yield outstanding.popleft().result()
+    for future in outstanding:
+        yield future.result()
+
+class _ExtractionRun:
+    """
+    Dedup and output-naming state for one extract_wallpapers() call
+    
+    Header reads, full hashes and copies run on the executor; the methods
+    themselves run on the main thread in file order, so which of two
+    duplicates is kept and which name each file gets are deterministic.
+    """
+    
+    def __init__(self, executor: ThreadPoolExecutor, output_path: Path, skip_duplicates: bool, min_size_mb: float,
+                 file_sizes: Dict[Path, int], file_mtimes: Dict[Path, int], cached_hashes: Dict[str, list]):
+        self.executor = executor
+        self.output_path = output_path
+        self.skip_duplicates = skip_duplicates
+        self.min_size_mb = min_size_mb
+        self.file_sizes = file_sizes
+        self.file_mtimes = file_mtimes
+        self.cached_hashes = cached_hashes
+        # Full hashes computed this run, in fingerprint cache format
+        self.updated_hashes: Dict[str, list] = {}
+        
+        # Group files by size: a file with a unique size can't have a duplicate, so it never needs hashing
+        self.size_groups: Dict[int, List[Path]] = defaultdict(list)
+        for ndf_file, file_size in file_sizes.items():
+            self.size_groups[file_size].append(ndf_file)
+        
+        # Quick fingerprint -> files already extracted with that fingerprint
+        self.seen_quick: Dict[Tuple[int, bytes], List[Path]] = {}
+        self.hash_futures: Dict[Path, Future] = {}
+        self.copy_futures: Dict[Path, Future] = {}
+        # Files whose full hash was read from disk this run (and so sit in the page cache)
+        self.hashed_from_disk: Set[Path] = set()
+        
+        # Names already in the output directory plus names chosen this run, so
+        # conflict resolution never has to stat the output directory
+        with os.scandir(output_path) as it:
+            self.taken_names: Set[str] = {os.path.normcase(entry.name) for entry in it}
+    
+    def needs_fingerprint(self, ndf_file: Path) -> bool:
+        """Only fingerprint files that could still be extracted and share their size with another file"""
+        file_size = self.file_sizes.get(ndf_file)
+        return (
+            self.skip_duplicates
+            and file_size is not None
+            and file_size >= self.min_size_mb * 1024 * 1024
+            and len(self.size_groups.get(file_size, ())) > 1
+        )
+    
+    def prefetched(self, ndf_files: List[Path], depth: int) -> Iterator[Tuple[Path, Future]]:
+        """Yield (file, inspection future) in order, keeping up to depth inspections in flight"""
+        remaining = iter(ndf_files)
+        pending = deque()
+        for ndf_file in islice(remaining, depth):
+            pending.append((ndf_file, self._submit_inspection(ndf_file)))
+        while pending:
+            ndf_file, inspection = pending.popleft()
+            for next_file in islice(remaining, 1):
+                pending.append((next_file, self._submit_inspection(next_file)))
+            yield ndf_file, inspection
+    
+    def _submit_inspection(self, ndf_file: Path) -> Future:
+        return self.executor.submit(inspect_file, ndf_file, self.file_sizes.get(ndf_file), self.needs_fingerprint(ndf_file))
+    
+    def _submit_full_hash(self, path: Path, size: int, drop_cache: bool = False) -> Future:
+        if path not in self.hash_futures:
+            self.hash_futures[path] = self.executor.submit(
+                hash_file_cached, path, size, self.file_mtimes.get(path),
+                self.cached_hashes.get(os.path.abspath(path)), drop_cache
+            )
+        return self.hash_futures[path]
+    
+    def _full_hash(self, path: Path, size: int) -> bytes:
+        file_hash, read_from_disk = self._submit_full_hash(path, size).result()
+        if read_from_disk:
+            self.hashed_from_disk.add(path)
+        mtime = self.file_mtimes.get(path)
+        if file_hash and mtime is not None:
+            self.updated_hashes[os.path.abspath(path)] = [mtime, size, file_hash.hex()]
+        return file_hash
     
-    # Look for .ndf files recursively
-    for file_path in cache_path.rglob("*.ndf"):
-        if file_path.is_file():
-            ndf_files.append(file_path)
+    def _is_duplicate(self, ndf_file: Path, file_size: int, quick_key: Tuple[int, bytes]) -> bool:
+        """Check a file against earlier files with the same quick fingerprint, confirming with full hashes"""
+        candidates = self.seen_quick.setdefault(quick_key, [])
+        if candidates:
+            # Hash this file and all candidates in parallel, alongside copies still in flight.
+            # Keep this file's pages cached for a possible copy; candidates whose copy
+            # has finished won't be read again, so theirs can be dropped
+            self._submit_full_hash(ndf_file, file_size)
+            for seen in candidates:
+                copy = self.copy_futures.get(seen)
+                self._submit_full_hash(seen, file_size, drop_cache=copy is not None and copy.done())
+            file_hash = self._full_hash(ndf_file, file_size)
+            if file_hash and any(self._full_hash(seen, file_size) == file_hash for seen in candidates):
+                return True
+        candidates.append(ndf_file)
+        return False
     
-    # Also check for .ndf_tmp files (incomplete downloads)
-    for file_path in cache_path.rglob("*.ndf_tmp"):
-        if file_path.is_file() and file_path.stat().st_size > 0:
-            ndf_files.append(file_path)
+    def _output_file(self, ndf_file: Path, image_format: str) -> Path:
+        """Pick a free output filename for a file and reserve it"""
+        base_name = ndf_file.stem
+        extension = '.png' if image_format == 'PNG' else f'.{image_format.lower()}'
+        output_file = self.output_path / f"{base_name}{extension}"
+        
+        # Handle filename conflicts
+        counter = 1
+        while os.path.normcase(output_file.name) in self.taken_names:
+            output_file = self.output_path / f"{base_name}_{counter}{extension}"
+            counter += 1
+        self.taken_names.add(os.path.normcase(output_file.name))
+        return output_file
     
-    return sorted(ndf_files)
+    def process(self, ndf_file: Path, inspection: Future) -> Future:
+        """Deduplicate a single .ndf file and start its copy, returning a Future of (status, message)"""
+        try:
+            # Verify it's an image (format and fingerprint come from the same read)
+            image_format, file_size, quick_key = inspection.result()
+            if not image_format:
+                return _completed(('skipped', f"{Color.WARNING}  ⚠️  Skipping (not a valid image): {ndf_file.name}{Color.ENDC}"))
+            
+            # Check file size to skip thumbnails
+            size_mb = file_size / (1024 * 1024)
+            if size_mb < self.min_size_mb:
+                return _completed(('skipped', f"{Color.WARNING}  ⚠️  Skipping (too small - {size_mb:.1f}MB): {ndf_file.name}{Color.ENDC}"))
+            
+            # Check for duplicates if requested
+            if quick_key is not None and self._is_duplicate(ndf_file, file_size, quick_key):
+                drop_page_cache(ndf_file)
+                return _completed(('skipped', f"{Color.WARNING}  ⚠️  Skipping (duplicate): {ndf_file.name}{Color.ENDC}"))
+            
+            # Copy the file on the pool
+            output_file = self._output_file(ndf_file, image_format)
+            self.copy_futures[ndf_file] = self.executor.submit(
+                copy_wallpaper, ndf_file, output_file, ndf_file in self.hashed_from_disk, size_mb, image_format
+            )
+            return self.copy_futures[ndf_file]
+            
+        except Exception as e:
+            logger.error("Failed to process %s: %s", ndf_file, e)
+            return _completed(('failed', f"{Color.FAIL}  ❌ Error processing {ndf_file.name}: {e}{Color.ENDC}"))
 
-def extract_wallpapers(cache_path: Path, output_path: Path, skip_duplicates: bool = True, min_size_mb: float = 1.0) -> Tuple[int, int, int]:
+def extract_wallpapers(cache_path: Path, output_path: Path, skip_duplicates: bool = True, min_size_mb: float = 1.0, max_workers: Optional[int] = None, use_cache: bool = True) -> Tuple[int, int, int]:
     """
     Extract wallpapers from .ndf files to the output directory
     
@@ -138,13 +676,16 @@ def extract_wallpapers(cache_path: Path, output_path: Path, skip_duplicates: boo
         output_path: Path to output directory for extracted images
         skip_duplicates: Whether to skip duplicate files
         min_size_mb: Minimum file size in MB to avoid thumbnails
+        max_workers: Number of worker threads reading, hashing and copying files (default: min(8, 2 * CPU count))
+        use_cache: Whether to reuse and update the on-disk fingerprint cache
         
     Returns:
         Tuple of (successful_extractions, skipped_files, failed_extractions)
     """
     print(f"{Color.OKBLUE}🔍 Scanning for .ndf files...{Color.ENDC}")
     
-    ndf_files = find_ndf_files(cache_path)
+    ndf_entries = find_ndf_entries(cache_path)
+    ndf_files = [Path(entry.path) for entry in ndf_entries]
     
     if not ndf_files:
         print(f"{Color.WARNING}❌ No .ndf files found in {cache_path}{Color.ENDC}")
@@ -155,65 +696,76 @@ def extract_wallpapers(cache_path: Path, output_path: Path, skip_duplicates: boo
     # Create output directory
     output_path.mkdir(parents=True, exist_ok=True)
     
+    # Sizes and mtimes come from the cached DirEntry stat results
+    file_sizes: Dict[Path, int] = {}
+    file_mtimes: Dict[Path, int] = {}
+    for ndf_file, entry in zip(ndf_files, ndf_entries):
+        try:
+            stat = entry.stat()
+        except OSError:
+            # Reported as a failure when the file is processed
+            continue
+        file_sizes[ndf_file] = stat.st_size
+        file_mtimes[ndf_file] = stat.st_mtime_ns
+    
+    # Full hashes from previous runs, keyed by path and valid while (mtime, size) match
+    cache_file = get_fingerprint_cache_file()
+    cached_hashes = load_fingerprint_cache(cache_file) if use_cache else {}
+    
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 1) * 2)
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    run = _ExtractionRun(executor, output_path, skip_duplicates, min_size_mb, file_sizes, file_mtimes, cached_hashes)
+    
     # Track statistics
     successful = 0
     skipped = 0
     failed = 0
-    file_hashes = set()
+    
+    progress_bar = tqdm(total=len(ndf_files), unit='file', desc='Extracting') if tqdm is not None else None
+    write = tqdm.write if tqdm is not None else print
     
     print(f"{Color.OKBLUE}🚀 Starting extraction...{Color.ENDC}")
     
-    for i, ndf_file in enumerate(ndf_files, 1):
-        try:
-            # Progress indicator
-            progress = f"[{i}/{len(ndf_files)}]"
-            print(f"{Color.OKCYAN}{progress} Processing: {ndf_file.name}{Color.ENDC}")
-            
-            # Verify it's an image
-            image_format = verify_image_format(ndf_file)
-            if not image_format:
-                print(f"{Color.WARNING}  ⚠️  Skipping (not a valid image): {ndf_file.name}{Color.ENDC}")
-                skipped += 1
-                continue
+    try:
+        # Workers read, hash and copy ahead; results are reported in file order
+        futures = (run.process(ndf_file, inspection)
+                   for ndf_file, inspection in run.prefetched(ndf_files, max(PREFETCH_DEPTH, max_workers)))
+        for processed, (status, message) in enumerate(results_in_order(futures, max_workers), 1):
+            # Only skips and errors are reported per file
+            if message:
+                write(message)
             
-            # Check file size to skip thumbnails
-            file_size = ndf_file.stat().st_size
-            size_mb = file_size / (1024 * 1024)
-            if size_mb < min_size_mb:
-                print(f"{Color.WARNING}  ⚠️  Skipping (too small - {size_mb:.1f}MB): {ndf_file.name}{Color.ENDC}")
+            if status == 'extracted':
+                successful += 1
+            elif status == 'skipped':
                 skipped += 1
-                continue
-            
-            # Check for duplicates if requested
-            if skip_duplicates:
-                file_hash = get_file_hash(ndf_file)
-                if file_hash in file_hashes:
-                    print(f"{Color.WARNING}  ⚠️  Skipping (duplicate): {ndf_file.name}{Color.ENDC}")
-                    skipped += 1
-                    continue
-                file_hashes.add(file_hash)
-            
-            # Generate output filename
-            base_name = ndf_file.stem
-            extension = '.png' if image_format == 'PNG' else f'.{image_format.lower()}'
-            output_file = output_path / f"{base_name}{extension}"
+            else:
+                failed += 1
             
-            # Handle filename conflicts
-            counter = 1
-            while output_file.exists():
-                output_file = output_path / f"{base_name}_{counter}{extension}"
-                counter += 1
-            
-            # Copy the file
-            shutil.copy2(ndf_file, output_file)
-            
-            print(f"{Color.OKGREEN}  ✓ Extracted: {output_file.name} ({size_mb:.1f}MB, {image_format}){Color.ENDC}")
-            successful += 1
-            
-        except Exception as e:
-            print(f"{Color.FAIL}  ❌ Error processing {ndf_file.name}: {e}{Color.ENDC}")
-            failed += 1
-            logger.error(f"Failed to process {ndf_file}: {e}")
+            # Progress indicator
+            if progress_bar is not None:
+                progress_bar.update(1)
+            elif processed % PROGRESS_INTERVAL == 0 or processed == len(ndf_files):
+                print(f"{Color.OKCYAN}[{processed}/{len(ndf_files)}] Processed ({successful} extracted){Color.ENDC}")
+    except BaseException:
+        # Don't wait for queued reads and copies after Ctrl-C or an error
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown()
+    finally:
+        if progress_bar is not None:
+            progress_bar.close()
+        
+        # Persist hashes even if extraction was interrupted
+        if use_cache:
+            scanned = {os.path.abspath(ndf_file) for ndf_file in ndf_files}
+            fingerprints = prune_fingerprint_cache(cached_hashes, cache_path, scanned)
+            fingerprints.update(run.updated_hashes)
+            if fingerprints != cached_hashes:
+                save_fingerprint_cache(cache_file, fingerprints)
     
     return successful, skipped, failed
 
@@ -228,6 +780,7 @@ Examples:
   python n0va_extractor.py "C:\\Program Files\\N0vaDesktop\\N0vaDesktopCache"
   python n0va_extractor.py "C:\\Program Files\\N0vaDesktop\\N0vaDesktopCache" "./extracted_wallpapers"
   python n0va_extractor.py --min-size 2.0 --verbose
+  python n0va_extractor.py --workers 32
         """
     )
     
@@ -251,6 +804,12 @@ Examples:
         help='Allow duplicate files (don\'t skip based on file hash)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Don\'t read or write the fingerprint cache used to speed up duplicate detection'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -264,10 +823,22 @@ Examples:
         help='Minimum file size in MB (default: 1.0MB to skip thumbnails)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker threads reading, hashing and copying files concurrently (default: min(8, 2 x CPU count); raise on fast NVMe drives)'
+    )
+    
     args = parser.parse_args()
     
+    logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be at least 1')
+    
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        logger.setLevel(logging.DEBUG)
     
     print_banner()
     
@@ -295,7 +866,9 @@ Examples:
             cache_path, 
             output_path, 
             skip_duplicates=not args.allow_duplicates,
-            min_size_mb=args.min_size
+            min_size_mb=args.min_size,
+            use_cache=not args.no_cache,
+            max_workers=args.workers
         )
         
         end_time = datetime.now()
@@ -318,7 +891,7 @@ Examples:
         sys.exit(1)
     except Exception as e:
         print(f"\n{Color.FAIL}❌ An unexpected error occurred: {e}{Color.ENDC}")
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":